@@ -7,8 +7,8 @@ from utils import (
     obtener_datos_filtrados, obtener_fft, obtener_frecuencia_dominante,
     obtener_amplitud_pico, estimar_amplitud_cm
 )
+from historial import HistorialMultiResolucion
 import numpy as np
-from collections import deque
 import csv
 import os
 import time
@@ -20,10 +20,9 @@ from datetime import datetime
 # Configuración
 logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 MAX_PUNTOS = 100
-frecuencia_deseada = deque(maxlen=MAX_PUNTOS)
-frecuencia_detectada = deque(maxlen=MAX_PUNTOS)
-tiempo = deque(maxlen=MAX_PUNTOS)
-amplitud_hist = deque(maxlen=MAX_PUNTOS)
+frecuencia_deseada = HistorialMultiResolucion()
+frecuencia_detectada = HistorialMultiResolucion()
+amplitud_hist = HistorialMultiResolucion()
 start_time = time.time()
 capturando = {"activo": False}
 
@@ -254,15 +253,30 @@ def update_graphs(n, ejes, freq_slider, lectura_activa, nivel_paciente):
         amplitud_cm = estimar_amplitud_cm(amplitud_g, real_freq)
 
         t_actual = time.time() - start_time
-        tiempo.append(t_actual)
-        frecuencia_deseada.append(freq_slider)
-        frecuencia_detectada.append(real_freq)
-        amplitud_hist.append(amplitud_g)
+        frecuencia_deseada.agregar(t_actual, freq_slider)
+        frecuencia_detectada.agregar(t_actual, real_freq)
+        amplitud_hist.agregar(t_actual, amplitud_g)
+
+        t_amp, amp_min, amp_max, amp_media = amplitud_hist.consultar(0, t_actual, MAX_PUNTOS)
+        # Banda min/max: un polígono por tramo para no rellenar las pausas
+        banda_x, banda_y, inicio = [], [], 0
+        for fin in [j for j, t in enumerate(t_amp) if t is None] + [len(t_amp)]:
+            if banda_x:
+                banda_x.append(None)
+                banda_y.append(None)
+            banda_x += t_amp[inicio:fin] + t_amp[inicio:fin][::-1]
+            banda_y += amp_max[inicio:fin] + amp_min[inicio:fin][::-1]
+            inicio = fin + 1
 
         fig_amp = go.Figure()
         fig_amp.add_trace(go.Scatter(
-            x=list(tiempo), y=list(amplitud_hist), mode='lines+markers',
-            name='Amplitud pico',
+            x=banda_x, y=banda_y, mode='lines', line=dict(width=0),
+            fill='toself', fillcolor='rgba(70,130,180,0.2)',
+            hoverinfo='skip', showlegend=False
+        ))
+        fig_amp.add_trace(go.Scatter(
+            x=t_amp, y=amp_media, mode='lines+markers',
+            name='Amplitud pico', connectgaps=False,
             line=dict(color='mediumblue', width=2, shape='spline'),
             marker=dict(size=4, color='steelblue', symbol='circle'),
             hovertemplate='Tiempo: %{x:.2f}s<br>Amplitud: %{y:.3f} g<extra></extra>'
@@ -0,0 +1,99 @@
+# historial.py
+import threading
+from collections import deque
+
+# Niveles por defecto: (resolución en segundos, número máximo de intervalos)
+# 0.5 s -> últimos 10 min, 5 s -> últimas 2 h, 1 min -> últimas 24 h
+NIVELES_POR_DEFECTO = ((0.5, 1200), (5.0, 1440), (60.0, 1440))
+
+
+class HistorialMultiResolucion:
+    """Historial de una variable con agregados min/max/media a varias resoluciones.
+
+    Cada nivel guarda un número acotado de intervalos, así que la memoria es
+    constante sin importar la duración de la sesión. Agregar una muestra es
+    O(1) y las consultas se responden desde el nivel más fino que cubre el
+    rango pedido con la cantidad de puntos solicitada.
+    """
+
+    def __init__(self, niveles=NIVELES_POR_DEFECTO):
+        self.niveles = sorted(niveles)
+        # Cada intervalo: [t_inicio, minimo, maximo, suma, n, t_ultima_muestra]
+        self._cerrados = [deque(maxlen=maximo) for _, maximo in self.niveles]
+        self._abiertos = [None] * len(self.niveles)
+        self._lock = threading.Lock()
+
+    def agregar(self, t, valor):
+        with self._lock:
+            for i, (resolucion, _) in enumerate(self.niveles):
+                t_inicio = (t // resolucion) * resolucion
+                abierto = self._abiertos[i]
+                if abierto is not None and abierto[0] == t_inicio:
+                    if valor < abierto[1]:
+                        abierto[1] = valor
+                    if valor > abierto[2]:
+                        abierto[2] = valor
+                    abierto[3] += valor
+                    abierto[4] += 1
+                    abierto[5] = t
+                    continue
+                if abierto is not None:
+                    self._cerrados[i].append(abierto)
+                self._abiertos[i] = [t_inicio, valor, valor, valor, 1, t]
+
+    def _intervalos(self, i):
+        intervalos = list(self._cerrados[i])
+        if self._abiertos[i] is not None:
+            intervalos.append(self._abiertos[i])
+        return intervalos
+
+    def consultar(self, t_ini, t_fin, max_puntos=100):
+        """Devuelve (tiempos, minimos, maximos, medias) con a lo sumo max_puntos en [t_ini, t_fin].
+
+        Las pausas en la adquisición se marcan con None en las cuatro listas.
+        """
+        max_puntos = max(max_puntos, 1)
+        with self._lock:
+            # Nivel más fino que aún conserva el inicio del rango
+            intervalos = []
+            for i, (resolucion, _) in enumerate(self.niveles):
+                intervalos = self._intervalos(i)
+                if not intervalos:
+                    return [], [], [], []
+                cerrados = self._cerrados[i]
+                if intervalos[0][0] <= t_ini or len(cerrados) < cerrados.maxlen:
+                    break
+
+            seleccion = [
+                iv for iv in intervalos
+                if iv[0] + resolucion > t_ini and iv[0] <= t_fin
+            ]
+
+        # Tramos sin pausas: un grupo nunca une intervalos separados por un hueco
+        tramos = []
+        for iv in seleccion:
+            if tramos and iv[0] - tramos[-1][-1][0] < resolucion * 1.5:
+                tramos[-1].append(iv)
+            else:
+                tramos.append([iv])
+
+        # Cada tramo recibe un punto más una parte del resto proporcional a su tamaño
+        resto = max(max_puntos - len(tramos), 0)
+        tiempos, minimos, maximos, medias = [], [], [], []
+        for tramo in tramos:
+            if tiempos:
+                # None corta la línea en Plotly durante la pausa
+                for lista in (tiempos, minimos, maximos, medias):
+                    lista.append(None)
+            n_grupos = min(len(tramo), 1 + resto * len(tramo) // len(seleccion))
+            for k in range(n_grupos):
+                grupo = tramo[k * len(tramo) // n_grupos:(k + 1) * len(tramo) // n_grupos]
+                suma = sum(iv[3] for iv in grupo)
+                n = sum(iv[4] for iv in grupo)
+                # Punto medio del grupo, sin pasar de la última muestra registrada
+                t_medio = grupo[0][0] + resolucion * len(grupo) / 2
+                tiempos.append(min(t_medio, grupo[-1][5]))
+                minimos.append(min(iv[1] for iv in grupo))
+                maximos.append(max(iv[2] for iv in grupo))
+                medias.append(suma / n)
+        return tiempos, minimos, maximos, medias
@@ -0,0 +1,52 @@
+from historial import HistorialMultiResolucion
+
+# Muestras cada 0.5 s, igual que el intervalo de actualización de app.py
+PERIODO = 0.5
+
+
+# 1) El número de puntos se mantiene cerca de max_puntos al crecer la sesión,
+#    consultando como lo hace app.py: desde t=0 hasta la última muestra
+historial = HistorialMultiResolucion()
+controles = {49.5, 50, 60, 100, 499.5, 600, 999.5, 3600, 7200}
+for k in range(int(2 * 3600 / PERIODO) + 1):
+    t = k * PERIODO
+    historial.agregar(t, t)
+    if t in controles:
+        tiempos, _, _, _ = historial.consultar(0, t, 100)
+        assert 95 <= len(tiempos) <= 100, (t, len(tiempos))
+print("✅ Presupuesto de puntos respetado")
+
+# 2) Tras el descarte del nivel fino, el rango completo sigue cubierto desde t=0
+tiempos, minimos, maximos, medias = historial.consultar(0, 7200, 100)
+assert minimos[0] == 0.0, minimos[0]
+assert maximos[-1] == 7200.0, maximos[-1]
+print("✅ Cobertura del rango tras descarte")
+
+# 3) Cambio de nivel: un rango reciente se responde con el nivel de 0.5 s
+tiempos, _, _, _ = historial.consultar(7150, 7200, 100)
+assert len(tiempos) == 100, len(tiempos)
+assert abs((tiempos[1] - tiempos[0]) - 0.5) < 1e-9, tiempos[:2]
+print("✅ Cambio de nivel correcto")
+
+# 4) Los tiempos son puntos medios y no superan la última muestra
+assert tiempos[-1] <= 7200.0, tiempos[-1]
+assert all(a < b for a, b in zip(tiempos, tiempos[1:]))
+print("✅ Tiempos en punto medio del intervalo")
+
+# 5) Una pausa en la lectura no se mezcla en ningún grupo ni se dibuja como dato
+historial = HistorialMultiResolucion()
+for k in range(202):
+    historial.agregar(k * PERIODO, 1.0)
+for k in range(200):
+    # Ritmo irregular, como los callbacks de Dash tras una pausa
+    historial.agregar(1000 + k * PERIODO + (0.1 if k % 3 else 0.0), 2.0)
+tiempos, minimos, maximos, medias = historial.consultar(0, 1100, 100)
+assert None in tiempos, "falta el separador de la pausa"
+assert not any(t is not None and 101 < t < 1000 for t in tiempos), tiempos
+for t, mn, mx, me in zip(tiempos, minimos, maximos, medias):
+    if t is None:
+        continue
+    esperado = 1.0 if t <= 101 else 2.0
+    assert mn == mx == me == esperado, (t, mn, mx, me)
+assert len([t for t in tiempos if t is not None]) <= 100
+print("✅ Pausas separadas correctamente")